@@ -0,0 +1,302 @@
+"""
+TicTacToe On Curses (Text Mode) - MultiBoard-VariableStrength
+=====================================
+Text-mode frontend, usable over SSH or on headless boxes.
+It never imports tkinter. Game rules & computer strategy come from
+TicTacToe_Rules (same as the Tkinter frontend).
+
+Human Player Vs Computer - (Human Player Has First Move)
+
+Keys:
+Arrow Keys (or h/j/k/l) - Move cursor on PlayBoard
+Enter / Space - Play at cursor position
+3 / 4 / 5 / 6 / 7 / 8 - Select Board Size (3x3 To 8x8)
+0 / 1 / 2 - Select Difficulty Level (Default Level Is 1)
+n - New Game
+s - Score Show/Hide
+q - Quit
+
+Startup time (module start to first screen drawn) is shown at bottom.
+It excludes interpreter launch.
+Run with --startup-time for full cold start to interactive: the frontend
+gets launched in a fresh interpreter, timed from just before the launch
+to its first draw, where it exits.
+"""
+import time
+
+# Taken before any other import, so that startup time covers them too
+_start_time = time.perf_counter()
+
+import sys
+from TicTacToe_Rules import TicTacToeRules
+
+class CursesTicTacToe(TicTacToeRules):
+    def __init__(self, stdscr, curses):
+        self.stdscr = stdscr
+        self.curses = curses  # curses module (imported lazily by main())
+
+        self.level_list = [0, 1, 2]  # Difficulty Levels
+        self.board_list = [3, 4, 5, 6, 7, 8]  # Board Size
+
+        # Some lists:
+        self.freeslot_list = []  # List for unoccupied slots
+        self.wincomb_list = []  # List of possible winning combinations
+        self.haswon_list = []  # List of actual winning combination
+        self.playermove_list = []  # List for player's moves
+        self.compmove_list = []  # List for computer's moves
+
+        # Some other initial values:
+        self.rows = 3  # Default Value
+        self.level = 1  # Default Value
+        self.cursor = 1  # Slot under cursor
+        self.winner = ""  # Winning Player - X or O
+        self.stalemate = False
+        self.score_on = False
+        self.msg = ""  # Notification text
+        self.startup_msg = ""
+
+        # Some Actions At StartUp
+        self.score_dict = self.make_scoredict()
+        self.show_playboard()
+
+    def notification_update(self, msg=""):
+        msg1 = "Selected Board: " \
+            + str(self.rows) + "x" + str(self.rows)
+        msg1 = msg1 + "\nSelected Difficulty Level: " \
+            + str(self.level)
+        msg1 = msg1 + "\n\nYou Play As X And Move First"
+        msg1 = msg1 + "\nComputer Plays As O"
+        msg1 = msg1 + "\n\nPick Any Free Slot on PlayBoard"
+        msg1 = msg1 + "\nTo Win: Fill A Row/Column/Diagonal"
+        if len(msg) > 0:
+            self.msg = msg
+        else:
+            self.msg = msg1
+
+    def show_playboard(self):
+        # Reset initial values
+        self.winner = ""
+        self.stalemate = False
+        self.haswon_list = []
+        self.playermove_list = []
+        self.compmove_list = []
+        self.cursor = 1
+
+        # rebuild freeslot_list & wincomb_list
+        # (as per latest selected board size)
+        self.freeslot_list = [s for s in range(1, 1 + self.rows * self.rows)]
+        self.wincomb_list = self.make_wincomblist()
+        self.notification_update()
+
+    def draw(self):
+        scr = self.stdscr
+        scr.erase()
+        maxy, maxx = scr.getmaxyx()
+        lines = ["TIC TAC TOE: Fill Any Row/Column/Diagonal To Win", ""]
+
+        # Each slot takes 4 chars, e.g. "| 12" or "| X "
+        sep = "+" + "----+" * self.rows
+        for r in range(self.rows):
+            lines.append(sep)
+            txt = "|"
+            for c in range(1, self.rows + 1):
+                s = r * self.rows + c
+                if s in self.playermove_list:
+                    mark = "X"
+                elif s in self.compmove_list:
+                    mark = "O"
+                else:
+                    mark = str(s)
+                if s == self.cursor:
+                    txt = txt + "[" + mark.center(2) + "]|"
+                else:
+                    txt = txt + " " + mark.center(2) + " |"
+            lines.append(txt)
+        lines.append(sep)
+        lines.append("")
+
+        if self.score_on:
+            lines.extend(self.get_score().split("\n"))
+        else:
+            lines.extend(self.msg.split("\n"))
+
+        lines.append("")
+        lines.append("Keys: Arrows Move, Enter Play, 3-8 Board, 0-2 Level, " \
+            + "n New Game, s Score, q Quit")
+        if len(self.startup_msg) > 0:
+            lines.append(self.startup_msg)
+
+        for y, txt in enumerate(lines[:maxy]):
+            attr = 0
+            if y > 1 and y < 2 + 2 * self.rows + 1 and "[" in txt:
+                attr = self.curses.A_BOLD
+            # Last screen cell can't be written to without an error
+            scr.addnstr(y, 0, txt, maxx - 1, attr)
+
+        scr.refresh()
+
+    def move_cursor(self, drow, dcol):
+        r = (self.cursor - 1) // self.rows
+        c = (self.cursor - 1) % self.rows
+        r = min(max(r + drow, 0), self.rows - 1)
+        c = min(max(c + dcol, 0), self.rows - 1)
+        self.cursor = r * self.rows + c + 1
+
+    def select_setting(self, key, val):
+        # key 1 for board size, 2 for difficulty level
+        if len(self.freeslot_list) < self.rows * self.rows:
+            self.notification_update(
+                "These Settings Can't Be Disturbed\n" \
+                + "As Game Is In Progress\n" \
+                + "Press 'n' For Fresh Start")
+            return
+
+        if key == 1:
+            self.rows = val
+        else:
+            self.level = val
+
+        self.show_playboard()
+
+    def play_click(self, btnval):
+        if len(self.winner) > 0 or self.stalemate \
+            or len(self.freeslot_list) == 0:
+            return   # Game Finished
+
+        if btnval in self.freeslot_list:
+            # Update the status of freeslot_list
+            self.freeslot_list = list(
+                filter(lambda x: x != btnval, self.freeslot_list))
+
+            self.playermove_list.append(btnval)
+
+            self.haswon_list = \
+                self.get_wonlist(self.playermove_list)
+            if len(self.haswon_list) > 0:
+                self.winner = "X"
+
+            if not self.stalemate and self.winner == "" \
+                and len(self.freeslot_list) > 0:
+                # Get Computer's Move
+                move = self.get_compmove()
+                if move > 0:
+                    # Update the status of freeslot_list
+                    self.freeslot_list = list(
+                        filter(lambda x: x != move, self.freeslot_list))
+
+                    self.compmove_list.append(move)
+
+                    self.haswon_list = \
+                        self.get_wonlist(self.compmove_list)
+                    if len(self.haswon_list) > 0:
+                        self.winner = "O"
+
+        self.game_status()
+
+    def game_status(self):
+        txt = ""
+        if len(self.winner) > 0:
+            if self.winner == "X":
+                self.update_scoredict(1, 0, 0)
+                txt = "Congratulations!\nYou (X)  have Won!"  \
+                    + "\n\nWinning Set Is: \n" + str(self.haswon_list)
+            else:
+                self.update_scoredict(0, 1, 0)
+                txt = "Computer (O) Has Won!"  \
+                    + "\nBetter Luck Next Time!" \
+                    + "\n\nWinning Set Is: \n" + str(self.haswon_list)
+        else:
+            self.stalemate = self.is_stalemate()
+            if self.stalemate or len(self.freeslot_list) == 0:
+                self.update_scoredict(0, 0, 1)
+                if self.stalemate:
+                    txt = "IT IS A STALEMATE" \
+                        + "\nGame Is Dead & Drawn."
+                else:
+                    txt = "GAME DRAWN" \
+                        + "\nIt Is A Tie! No Winner"
+
+        if len(txt) > 0:
+            txt1 = "\n\nFor Score: Press 's'" \
+                + "\nFor New Game: Press 'n'"
+            self.notification_update(txt + txt1)
+
+    def run(self, launch_time=""):
+        curses = self.curses
+        self.draw()
+        if launch_time:
+            # Launched by measure_startup(): time since launch (wall clock)
+            return (time.time() - float(launch_time)) * 1000
+
+        ms = (time.perf_counter() - _start_time) * 1000
+        self.startup_msg = "Startup (Excl. Interpreter Launch): %.1f ms" % ms
+
+        while True:
+            self.draw()
+            ch = self.stdscr.getch()
+            if ch in (ord("q"), ord("Q")):
+                break
+            elif ch in (curses.KEY_UP, ord("k")):
+                self.move_cursor(-1, 0)
+            elif ch in (curses.KEY_DOWN, ord("j")):
+                self.move_cursor(1, 0)
+            elif ch in (curses.KEY_LEFT, ord("h")):
+                self.move_cursor(0, -1)
+            elif ch in (curses.KEY_RIGHT, ord("l")):
+                self.move_cursor(0, 1)
+            elif ch in (curses.KEY_ENTER, 10, 13, ord(" ")):
+                self.play_click(self.cursor)
+            elif ch in [ord(str(b)) for b in self.board_list]:
+                self.select_setting(1, ch - ord("0"))
+            elif ch in [ord(str(d)) for d in self.level_list]:
+                self.select_setting(2, ch - ord("0"))
+            elif ch in (ord("n"), ord("N")):
+                self.show_playboard()
+            elif ch in (ord("s"), ord("S")):
+                self.score_on = not self.score_on
+
+        return 0
+
+def measure_startup():
+    """
+    Cold start to interactive, interpreter launch included:
+    The frontend gets launched in a fresh interpreter, which exits
+    right after its first draw & prints the time since launch.
+    """
+    import os
+    import subprocess
+
+    env = dict(os.environ, TICTACTOE_LAUNCH_TIME=repr(time.time()))
+    subprocess.run([sys.executable, os.path.abspath(__file__),
+        "--first-draw"], env=env)
+
+def main(argv):
+    if "--startup-time" in argv:
+        measure_startup()
+        return
+
+    # Lazy import: curses gets loaded only when the frontend is launched
+    import curses
+
+    launch_time = ""
+    if "--first-draw" in argv:
+        import os
+        launch_time = os.environ["TICTACTOE_LAUNCH_TIME"]
+
+    def start(stdscr):
+        try:
+            curses.curs_set(0)  # Hide terminal cursor
+        except curses.error:
+            pass  # Not supported by every terminal
+        stdscr.keypad(True)
+        return CursesTicTacToe(stdscr, curses).run(launch_time)
+
+    ms = curses.wrapper(start)
+    if launch_time:
+        print("Cold Start To Interactive (Incl. Interpreter Launch): "
+            "%.1f ms" % ms)
+
+#============================
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
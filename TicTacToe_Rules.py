@@ -0,0 +1,572 @@
+"""
+TicTacToe - MultiBoard-VariableStrength: Game Rules & Computer Strategy
+Developed By A.D.Tejpal - 24-Mar-2021
+=====================================
+Shared by all frontends (Tkinter & Curses).
+This module must not import tkinter, so that text-mode frontend
+can start up fast (e.g. over SSH or on headless boxes).
+
+Class TicTacToeRules is used as a mixin. It expects the frontend to hold:
+level_list, board_list - Available difficulty levels & board sizes
+rows, level - Selected board size & difficulty level
+freeslot_list - List for unoccupied slots
+wincomb_list - List of possible winning combinations
+playermove_list - List for player's moves
+compmove_list - List for computer's moves
+score_dict - Running Score (built by make_scoredict())
+"""
+import random
+
+class TicTacToeRules:
+    def make_scoredict(self):
+        """
+        It bulds a dictionary of sub-dictionaries for Running Score:    
+        Parent Dictionary Keys (0, 1 2): For Computer Strength Level
+        Sub-Dictionary Keys (e.g. 3, 4, 5, 6, 7, 8): For Board Size
+        Each sub-dictionary has a sub-list with three elements.
+        Elements in each sub-list: PlayerWin, ComputerWin, Drawn
+        """
+        # Initialize main dictionary serving as overall container
+        scdict = {}
+        for lev in self.level_list:
+            # Initialize Sub-Dictionaries For Each Difficulty Level
+            scdict[lev] = {}
+            for board in self.board_list:
+                # Initialize Sub-Lists For Each Board - For Each Level
+                scdict[lev][board] = [0, 0, 0]
+
+        return scdict
+
+    def make_wincomblist(self):
+        """
+        Builds a list of sublists of potential Winning Combinations
+        (Rows, Columns & diagonals)
+        """
+        wlist = []
+        
+        # SubLists for row combinations
+        for x in range(1,
+            (self.rows * self.rows - (self.rows - 1) + 1), self.rows):
+            sublist = []
+            for n in range(self.rows):    
+                sublist.append(n + x)
+
+            wlist.append(sublist)
+
+        # SubLists for column combinations
+        for x in range(1, self.rows + 1):
+            sublist = []
+            for n in range(x,
+                x + (self.rows * self.rows - (self.rows - 1) + 1), self.rows):
+                sublist.append(n)
+
+            wlist.append(sublist)
+
+        """
+        SubLists of two diagonal-wise combinations
+        This loop runs only for two cycles
+        In first one, it starts at first slot in top row
+        In 2nd round, it starts at last slot in top row
+        """
+        # Step margin between adjacent values - First Diagonal
+        sp = self.rows + 1
+        for x in range(1, self.rows + 1, self.rows - 1):
+            sublist = []
+            ct = 0        
+            while ct < self.rows:
+                n = x + sp * ct
+                sublist.append(n)
+                ct = ct + 1
+
+            # Step margin between adjacent values - 2nd Diagonal
+            sp = self.rows - 1
+
+            wlist.append(sublist)
+
+        return wlist
+
+    def make_celllinedict(self):
+        """
+        Builds a dictionary mapping each slot to the indices (in wincomb_list)
+        of the rows, columns & diagonals passing through it
+        """
+        cldict = {}
+        for s in range(1, 1 + self.rows * self.rows):
+            cldict[s] = []
+
+        for idx, x in enumerate(self.wincomb_list):
+            for s in x:
+                cldict[s].append(idx)
+
+        return cldict
+
+    def get_linevalue(self, line, playermove_set, compmove_set):
+        """
+        Returns the value of a row/column/diagonal for the player (X)
+        Zero if the computer already holds a slot in it (line is dead for X)
+        Otherwise it rises steeply with the number of player's slots in it
+        """
+        if len(compmove_set.intersection(line)) > 0:
+            return 0
+
+        return (1 + len(playermove_set.intersection(line))) ** 2
+
+    def get_bestmove_list(self, move_list):
+        """
+        Based upon moves made so far (moveList), it returns shortest list of remaining moves for win.
+        
+        wincomb_list is a list having sub-lists of possible winning combinations for rows, columns & diagonals
+        """
+        # Initialize default value of bestmove_list
+        bmlist = [*self.freeslot_list]
+        # If only one slot is free, no need to check further. 
+        if len(bmlist) > 1:
+            for x in self.wincomb_list:
+                # Intersection of current sublist of winning combinations and moves made so far
+                s1 = [item for item in x if item in move_list]
+
+                if len(s1) > 0: 
+                    # Intersection difference of current sublist and s1
+                    # This represents the balance moves for win
+                    s2 = [item for item in x if item not in s1]
+                    
+                    # Intersection of s2 & free slots
+                    # (i.e. whether all potential slots in balance win list are free)
+                    s3 = [item for item in s2 if item in self.freeslot_list]
+
+                    # If all slots in s2 are free and s2 is shorter than bmList, assign the contents of s2 to s 
+                    if len(s2) == len(s3) and len(s2) < len(bmlist):
+                        bmlist = [*s2]
+
+                if len(bmlist) == 1:
+                    # This is a winning move. No need to explore further.
+                    break
+
+        return bmlist
+
+    def get_wonlist(self, move_list):
+        """
+        If game won, returns the list of completed row/column/diagonal
+        Otherwise, an empty list
+        wincomb_list: A list having sub-lists of possible winning combinations of rows, columns & diagonals
+        """
+        wlist = []
+        moveset = set(move_list)
+        for x in self.wincomb_list:
+            if set(x).issubset(moveset):
+                wlist = x
+                break
+
+        return wlist
+
+    def haswon(self, move_list):
+        """
+        Finds whether move_list represents Victory
+        (completed row/column/diagonal)
+
+        wincomb_list: A list having sub-lists of possible winning combinations for rows, columns & diagonals
+        """
+        won = False
+        moveset = set(move_list)
+        for x in self.wincomb_list:
+            if set(x).issubset(moveset):
+                won = True
+                break
+
+        return won
+
+    def is_stalemate(self):
+        """
+        Finds whether whether the game has reached a stalemate
+        (Despite free slots, winning combination is no longer feasible)
+
+        wincomb_list: A list of sub-lists of possible winning combinations for rows, columns & diagonals
+        """
+        smate = True
+        for x in self.wincomb_list:
+            # Check if any sublist of winning combinations is still pure
+            # (Free from a mix of player & computer moves in same sublist)
+            if len([item for item in x if item in self.playermove_list]) == 0 \
+                or len([item for item in x if item in self.compmove_list]) == 0:
+                smate = False
+                break
+
+        return smate
+
+    def get_compmove(self):
+        """
+        Determines computer's next move.
+        wincomb_list: A list having sub-lists of winning combinations for rows, columns & diagonals
+        compmove_list is a list holding moves made by the computer.
+        playermove_list is a list holding moves made by the player.
+        freeslot_list is a list of free slots still available.
+
+        level is the difficulty level, i.e. strength setting for computer
+        Options: 0 / 1 / 2  (Defaul Level Is 1)
+        Level 0 - Computer plays random moves and discontinues blocking opponents victory, after 50% slots get filled up
+        Level 1 - Computer plays optimum moves but discontinues blocking opponents victory, after 70% slots get filled up
+        Level 2 - Computer plays at full strength as follows:
+             (a) Firstly, go for immediate win if available.
+             (b) Otherwise, block opponent if on the verge of immediate win.
+             (c) Otherwise, pick up a move from shortest winning path available.
+        """
+        if len(self.freeslot_list) == 0:
+            # No move available
+            return 0
+        
+        cm = 0  # default value for computer move
+        
+        # Get the list of best moves available for player
+        bestplayermove_list = self.get_bestmove_list(
+            self.playermove_list)
+        
+        if self.level > 0:
+            # Get the list of best moves available for computer
+            bestcompmove_list = self.get_bestmove_list(
+                self.compmove_list)
+            
+            if len(bestcompmove_list) > 1:
+                # There is no immediate win for computer.
+                # Check if the player has an immediate win in sight
+                if len(bestplayermove_list) == 1:
+                    # There is an immediate win for player.
+                    # Block it if level is 2
+                    # Or for level 1 and more than 30% free slots available
+                    if self.level ==2 or (self.level == 1 and
+                        len(self.freeslot_list) > \
+                            round((self.rows * self.rows * 0.3))):
+                        # Block opponent's win
+                        cm = bestplayermove_list[0]
+                else:
+                    # Select a random value from bestcompmove_list
+                    cm = random.choice(bestcompmove_list)
+            else:
+                # The computer has an immediate winning move:
+                cm = bestcompmove_list[0]
+        else:
+            # Computer is playing at level 0 (weak strength)
+            # If more than 50% free slots are still available
+            # And the player has an immediate win in sight, block it
+            if len(bestplayermove_list) == 1 and \
+                len(self.freeslot_list) > \
+                round((self.rows * self.rows * 0.5)):
+                    cm = bestplayermove_list[0]
+
+        if cm == 0:
+            # Select a random value from freeslot_list
+            cm = random.choice(self.freeslot_list)
+
+        return cm
+
+    def update_scoredict(self, 
+        playerwin, compwin, drawn):
+        # The arguments: 0 or 1 (e.g. 1,0,0 / 0,1,0 / 0,0,1)
+        self.score_dict[self.level][self.rows][0] = \
+            self.score_dict[self.level][self.rows][0] + playerwin
+        self.score_dict[self.level][self.rows][1] = \
+            self.score_dict[self.level][self.rows][1] + compwin
+        self.score_dict[self.level][self.rows][2] = \
+            self.score_dict[self.level][self.rows][2] + drawn
+
+    def get_score(self):
+        txt = ""
+        totgames = 0
+        totplayerwins = 0
+        totcompwins = 0
+        totdrawn = 0
+        for lev in self.level_list:
+            subdict = self.score_dict[lev]
+            for board in self.board_list:
+                scorelist = subdict[board]
+                games = sum(scorelist)
+                totgames = totgames + games
+                totplayerwins = totplayerwins + scorelist[0]
+                totcompwins = totcompwins + scorelist[1]
+                totdrawn = totdrawn + scorelist[2]
+                if games > 0:
+                    txt = txt + "\nDifficulty Level: " + str(lev) \
+                        + ", Board Size: " + str(board) + "x" + str(board)
+                    txt= txt + "\nGames: " \
+                         + str(games) + ", PlayerWins: " \
+                        + str(scorelist[0]) + ", CompWins: " \
+                        + str(scorelist[1]) + ", Drawn: " \
+                        + str(scorelist[2]) + "\n"
+
+        #txt = txt + "\nOverAll Summary-Grand Total:"
+        txt1 = "\nOverAll Summary-Grand Total:"
+        txt1 = txt1 + "\nTot Games: " \
+            + str(totgames) + ", PlayerWins: " \
+            + str(totplayerwins) + ", CompWins: " \
+            + str(totcompwins) + ", Drawn: " + str(totdrawn)
+        txt = "Cumulative Score:" + txt1 + "\n" + txt
+        return txt
+
+class TicTacToeBoard(TicTacToeRules):
+    """
+    State of a single game, independent of any frontend.
+    Used where many games are live at once (e.g. simultaneous play).
+    score_dict is shared with the frontend, so that results of all boards
+    get into the same Running Score.
+    """
+    def __init__(self, rows, level, score_dict):
+        self.level_list = [0, 1, 2]  # Difficulty Levels
+        self.board_list = [3, 4, 5, 6, 7, 8]  # Board Size
+        self.rows = rows
+        self.level = level
+        self.score_dict = score_dict
+        self.new_game()
+
+    def new_game(self):
+        self.winner = ""  # Winning Player - X or O
+        self.stalemate = False
+        self.finished = False
+        self.haswon_list = []
+        self.playermove_list = []
+        self.compmove_list = []
+        self.freeslot_list = [s for s in range(1, 1 + self.rows * self.rows)]
+        self.wincomb_list = get_wincomblist(self)
+
+    def play_move(self, move, mark):
+        """
+        Records a move for player (mark X) or computer (mark O).
+        Returns False if the slot is not free.
+        """
+        if move not in self.freeslot_list:
+            return False
+
+        # Update the status of freeslot_list
+        self.freeslot_list = list(
+            filter(lambda x: x != move, self.freeslot_list))
+
+        if mark == "X":
+            move_list = self.playermove_list
+        else:
+            move_list = self.compmove_list
+
+        move_list.append(move)
+        self.haswon_list = self.get_wonlist(move_list)
+        if len(self.haswon_list) > 0:
+            self.winner = mark
+
+        return True
+
+    def get_playermove(self, level):
+        """
+        Determines player's (X) next move, with the computer's strategy
+        playing for X at given difficulty level
+        (Used for computer-vs-computer play)
+        """
+        # Swap sides for a moment, so that get_compmove() plays for X
+        complevel = self.level
+        self.level = level
+        self.playermove_list, self.compmove_list = \
+            self.compmove_list, self.playermove_list
+        try:
+            move = self.get_compmove()
+        finally:
+            self.level = complevel
+            self.playermove_list, self.compmove_list = \
+                self.compmove_list, self.playermove_list
+
+        return move
+
+    def game_status(self):
+        """
+        Finds whether the game is over (won, stalemate or tie).
+        Running Score gets updated only once per game.
+        """
+        if self.finished:
+            return True
+
+        if len(self.winner) > 0:
+            if self.winner == "X":
+                self.update_scoredict(1, 0, 0)
+            else:
+                self.update_scoredict(0, 1, 0)
+            self.finished = True
+        else:
+            self.stalemate = self.is_stalemate()
+            if self.stalemate or len(self.freeslot_list) == 0:
+                self.update_scoredict(0, 0, 1)
+                self.finished = True
+
+        return self.finished
+
+class TicTacToeFastBoard(TicTacToeBoard):
+    """
+    Same game as TicTacToeBoard, with an optimized engine.
+    Moves are also kept as bitmasks (bit n set for slot n), so that
+    row/column/diagonal checks become integer operations.
+    It must agree exactly with TicTacToeRules (same moves, same winning
+    list, same stalemate, same random choices from same lists).
+    TicTacToe_Harness.py checks that, & times both engines.
+    """
+    def new_game(self):
+        super().new_game()
+        self.playermove_mask = 0
+        self.compmove_mask = 0
+        self.linemask_list = get_linemasklist(self)
+
+    def play_move(self, move, mark):
+        if move not in self.freeslot_list:
+            return False
+
+        # Mask must be up to date before the win check in play_move()
+        if mark == "X":
+            self.playermove_mask = self.playermove_mask | (1 << move)
+        else:
+            self.compmove_mask = self.compmove_mask | (1 << move)
+
+        return super().play_move(move, mark)
+
+    def get_movemask(self, move_list):
+        # Masks are at hand for both players, else build one
+        if move_list is self.playermove_list:
+            return self.playermove_mask
+        elif move_list is self.compmove_list:
+            return self.compmove_mask
+
+        mask = 0
+        for s in move_list:
+            mask = mask | (1 << s)
+
+        return mask
+
+    def get_bestmove_mask(self, own_mask, opp_mask):
+        # Same as get_bestmove_list() of TicTacToeRules
+        # A line is open for a player if opponent holds no slot in it
+        bmlist = self.freeslot_list
+        bmlen = len(bmlist)
+        if bmlen > 1:
+            for idx, lm in enumerate(self.linemask_list):
+                if lm & own_mask and not lm & opp_mask:
+                    n = bin(lm & ~own_mask).count("1")
+                    if n < bmlen:
+                        bmlen = n
+                        bmlist = [s for s in self.wincomb_list[idx]
+                            if not own_mask & (1 << s)]
+
+                if bmlen == 1:
+                    break
+
+        return [*bmlist]
+
+    def get_bestmove_list(self, move_list):
+        own_mask = self.get_movemask(move_list)
+        # Opponent's slots are the ones neither free nor own
+        opp_mask = self.get_movemask(self.freeslot_list) | own_mask
+        opp_mask = opp_mask ^ get_fullmask(self)
+        return self.get_bestmove_mask(own_mask, opp_mask)
+
+    def get_wonlist(self, move_list):
+        mask = self.get_movemask(move_list)
+        for idx, lm in enumerate(self.linemask_list):
+            if lm & mask == lm:
+                return self.wincomb_list[idx]
+
+        return []
+
+    def haswon(self, move_list):
+        return len(self.get_wonlist(move_list)) > 0
+
+    def is_stalemate(self):
+        xmask = self.playermove_mask
+        omask = self.compmove_mask
+        for lm in self.linemask_list:
+            if not lm & xmask or not lm & omask:
+                return False
+
+        return True
+
+    def get_compmove(self):
+        # Same decisions as get_compmove() of TicTacToeRules
+        if len(self.freeslot_list) == 0:
+            return 0
+
+        cm = 0
+        bestplayermove_list = self.get_bestmove_mask(
+            self.playermove_mask, self.compmove_mask)
+
+        if self.level > 0:
+            bestcompmove_list = self.get_bestmove_mask(
+                self.compmove_mask, self.playermove_mask)
+
+            if len(bestcompmove_list) > 1:
+                if len(bestplayermove_list) == 1:
+                    if self.level ==2 or (self.level == 1 and
+                        len(self.freeslot_list) > \
+                            round((self.rows * self.rows * 0.3))):
+                        cm = bestplayermove_list[0]
+                else:
+                    cm = random.choice(bestcompmove_list)
+            else:
+                cm = bestcompmove_list[0]
+        else:
+            if len(bestplayermove_list) == 1 and \
+                len(self.freeslot_list) > \
+                round((self.rows * self.rows * 0.5)):
+                    cm = bestplayermove_list[0]
+
+        if cm == 0:
+            cm = random.choice(self.freeslot_list)
+
+        return cm
+
+    def get_playermove(self, level):
+        # Masks get swapped along with the lists
+        self.playermove_mask, self.compmove_mask = \
+            self.compmove_mask, self.playermove_mask
+        try:
+            move = super().get_playermove(level)
+        finally:
+            self.playermove_mask, self.compmove_mask = \
+                self.compmove_mask, self.playermove_mask
+
+        return move
+
+# Winning combinations depend only upon board size
+# So boards of same size share one wincomb_list (it is never modified)
+_wincomb_dict = {}
+
+def get_wincomblist(board):
+    if board.rows not in _wincomb_dict:
+        _wincomb_dict[board.rows] = board.make_wincomblist()
+
+    return _wincomb_dict[board.rows]
+
+_linemask_dict = {}
+
+def get_linemasklist(board):
+    """
+    Bitmasks of winning combinations, in the same order as wincomb_list
+    """
+    if board.rows not in _linemask_dict:
+        mlist = []
+        for x in get_wincomblist(board):
+            mask = 0
+            for s in x:
+                mask = mask | (1 << s)
+            mlist.append(mask)
+
+        _linemask_dict[board.rows] = mlist
+
+    return _linemask_dict[board.rows]
+
+def get_fullmask(board):
+    # Bitmask with all slots of the board set
+    return ((1 << (board.rows * board.rows + 1)) - 1) ^ 1
+
+def get_compmoves(board_list):
+    """
+    Determines computer's next move for each board in board_list
+    (i.e. all boards awaiting computer's reply).
+    Returns a list of moves, in the same order as board_list.
+    It is a plain per-board loop behind a batch interface: each board is
+    an independent game, so no search work is shared. The only thing
+    shared is wincomb_list among boards of the same size.
+    """
+    move_list = []
+    for board in board_list:
+        move_list.append(board.get_compmove())
+
+    return move_list
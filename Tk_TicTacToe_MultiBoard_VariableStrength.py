@@ -23,6 +23,20 @@ Level 2 - Computer plays at full strength as follows:
 
 Result (Running Score) can be viewed by clicking 'Score Show/Hide' button
 
+Hint overlay can be toggled by clicking 'Hints On/Off' button
+(Free slots get tinted as per their rating for X - deeper tint for better slot)
+
+Simul Mode (click 'Simul Mode' button) - Play many boards at once
+Each board has its own size & difficulty level
+Computer replies on all boards awaiting it together, shortly after your move
+
+While you are thinking, computer precomputes its reply to your likely moves
+(Pondering) - Its hit rate is shown along with the Running Score
+
+Spectator Mode (click 'Spectate On/Off' button) - Computer Vs Computer
+O plays at selected difficulty level, X cycles through levels 0 / 1 / 2
+Games go on continuously (with Games/Sec & Moves/Sec shown) and count in Running Score
+
 At any stage, fresh game can be started by clicking 'New Game' button
 
 Dictionary design for storing button pointers & relevant values:
@@ -41,9 +55,17 @@ Each such sublist has two elements (button object pointer & button value (i.e. p
 """
 import tkinter as tk
 import tkinter.messagebox as msgbox
-import random
+import threading
+import queue
+import time
+from TicTacToe_Rules import TicTacToeRules, TicTacToeBoard, \
+    TicTacToeFastBoard, get_compmoves
+
+class TicTacToe(TicTacToeRules, tk.Tk):
+    ponder_limit = 16  # Max player's moves pondered per position
+    ponder_budget = 0.005  # Max seconds per pondering slice
+    spectate_fps = 20  # Frames per second in spectator mode
 
-class TicTacToe(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("TIC TAC TOE: Fill Any Row/Column/Diagonal To Win")
@@ -79,6 +101,14 @@ class TicTacToe(tk.Tk):
         self.haswon_list = []  # List of actual winning combination
         self.playermove_list = []  # List for player's moves
         self.compmove_list = []  # List for computer's moves
+        self.cellline_dict = {}  # Slot: indices of wincomb_list thru it
+        self.hintline_dict = {}  # wincomb_list index: line value for X
+        self.hint_dict = {}  # Free slot: its rating for X
+        self.hintpending_set = set()  # Slots moved since last hint run
+        self.ponder_dict = {}  # Position: Precomputed computer's reply
+        self.ponder_list = []  # Player's likely moves yet to be pondered
+        self.spectate_queue = queue.Queue()  # Results from spectate worker
+        self.hint_queue = queue.Queue()  # Results from hint worker
 
         # Some other initial values:
         self.cum_x = 0
@@ -89,31 +119,30 @@ class TicTacToe(tk.Tk):
         self.winner = ""  # Winning Player - X or O
         self.stalemate = False
         self.click_disabled = False
+        self.hint_on = False  # Hint overlay toggle
+        self.hint_busy = False  # Hint worker running
+        self.hint_generation = 0  # Bumped on every new game
+        self.simul_win = None  # Window for Simul Mode
+        self.ponder_on = True  # Precompute replies while player thinks
+        self.ponder_id = None  # after_idle() id of next pondering slice
+        self.ponder_hits = 0  # Replies found in ponder cache
+        self.ponder_misses = 0  # Replies computed on demand
+        self.spectating = False  # Computer-vs-computer spectator mode
+        self.spectate_generation = 0  # Bumped to stop spectate worker
+        self.spectate_id = None  # after() id of next spectator frame
+        self.spectate_snapshot = None  # Latest position from worker
+        self.spectate_games = 0  # Games completed by worker
+        self.spectate_moves = 0  # Moves made by worker
+        self.spectate_drawngame = 0  # Game No. on PlayBoard
+        self.spectate_drawnmoves = (0, 0)  # X & O moves on PlayBoard
+        self.spectate_rate = (0, 0, 0)  # (Time, games, moves) at last readout
+        self.spectate_ratetxt = ""  # Games/Sec & Moves/Sec readout
 
         # Some Actions At StartUp
         self.score_dict = self.make_scoredict()
         self.make_widgets()
         self.show_playboard()
 
-    def make_scoredict(self):
-        """
-        It bulds a dictionary of sub-dictionaries for Running Score:    
-        Parent Dictionary Keys (0, 1 2): For Computer Strength Level
-        Sub-Dictionary Keys (e.g. 3, 4, 5, 6, 7, 8): For Board Size
-        Each sub-dictionary has a sub-list with three elements.
-        Elements in each sub-list: PlayerWin, ComputerWin, Drawn
-        """
-        # Initialize main dictionary serving as overall container
-        scdict = {}
-        for lev in self.level_list:
-            # Initialize Sub-Dictionaries For Each Difficulty Level
-            scdict[lev] = {}
-            for board in self.board_list:
-                # Initialize Sub-Lists For Each Board - For Each Level
-                scdict[lev][board] = [0, 0, 0]
-
-        return scdict
-
     def make_widgets(self):        
         lbwd_hdg = int(0.35 * self.screen_wd)  # Hdg Label Width
         lbht_hdg = int(0.07 * self.screen_ht)  # Hdg Label Height
@@ -263,7 +292,7 @@ class TicTacToe(tk.Tk):
         vertgap = 5
         self.cum_y = self.cum_y + vertgap
         lbht = int(0.85 * (self.screen_ht - self.cum_y)) \
-            - int(0.7 * lbht_hdg)  # Allowing space for bottom button
+            - int(1.4 * lbht_hdg)  # Allowing space for two bottom rows
         fontsize = int(self.fontsize_hdg / 2)
 
         self.notification_label = tk.Label( self,
@@ -276,10 +305,10 @@ class TicTacToe(tk.Tk):
         self.cum_y = self.cum_y + lbht
         self.notification_update()
 
-        # Create buttons for New Game & For Running Score:
+        # Create buttons for New Game, For Running Score & For Hints:
         vertgap = 5
         self.cum_y = self.cum_y + vertgap
-        btnwd = int(lbwd_hdg / 2)
+        btnwd = int(lbwd_hdg / 3)
         btnht = int(0.7 * lbht_hdg)
         fontsize = int(self.fontsize_hdg / 2)
         self.newgame_btn = tk.Button(self, text="New Game", 
@@ -296,6 +325,31 @@ class TicTacToe(tk.Tk):
         self.score_btn.place(x = self.start_x + btnwd,
             y = self.cum_y, width=btnwd, height=btnht)
 
+        self.hint_btn = tk.Button(self, text="Hints On/Off", 
+            font="Times "+str(fontsize)+" bold",
+            bg="light gray", fg="black", bd=bwd,
+            command = self.toggle_hint)
+        self.hint_btn.place(x = self.start_x + btnwd * 2,
+            y = self.cum_y, width=btnwd, height=btnht)
+
+        self.cum_y = self.cum_y + btnht
+
+        # Create button for Simul Mode (in 2nd row):
+        btnwd = int(lbwd_hdg / 2)
+        self.simul_btn = tk.Button(self, text="Simul Mode", 
+            font="Times "+str(fontsize)+" bold",
+            bg="light gray", fg="black", bd=bwd,
+            command = self.show_simul)
+        self.simul_btn.place(x = self.start_x,
+            y = self.cum_y, width=btnwd, height=btnht)
+
+        self.spectate_btn = tk.Button(self, text="Spectate On/Off", 
+            font="Times "+str(fontsize)+" bold",
+            bg="light gray", fg="black", bd=bwd,
+            command = self.toggle_spectate)
+        self.spectate_btn.place(x = self.start_x + btnwd,
+            y = self.cum_y, width=btnwd, height=btnht)
+
         self.cum_y = self.cum_y + btnht
         
     def toggle_score(self):
@@ -304,6 +358,200 @@ class TicTacToe(tk.Tk):
         else:
             self.show_score()
 
+    def show_simul(self):
+        # Only one simul window at a time
+        if self.simul_win is not None and self.simul_win.winfo_exists():
+            self.simul_win.lift()
+        else:
+            self.simul_win = SimulWindow(self)
+
+    def toggle_spectate(self):
+        if self.spectating:
+            self.spectate_btn.config(bg="light gray", bd=1)
+            self.spectate_stop()
+            self.spectating = False
+            self.show_playboard()
+        else:
+            if self.hint_on:
+                self.toggle_hint()
+
+            self.spectate_btn.config(bg="light green", bd=3)
+            self.spectating = True
+            self.ponder_stop()
+            self.show_playboard()
+            self.spectate_start()
+
+    def spectate_start(self):
+        """
+        Computer-vs-computer play: O at selected difficulty level,
+        X cycling through all levels, game after game.
+        Games are played in a worker thread as fast as possible.
+        The PlayBoard only samples the latest position, spectate_fps
+        times a second (intermediate moves get skipped if need be).
+        """
+        # Fresh counters for this session (see __init__)
+        self.spectate_snapshot = None
+        self.spectate_games = 0
+        self.spectate_moves = 0
+        self.spectate_drawngame = 0
+        self.spectate_drawnmoves = (0, 0)
+        self.spectate_rate = (time.perf_counter(), 0, 0)
+        self.spectate_ratetxt = ""
+
+        worker = threading.Thread(target=self.spectate_worker,
+            args=(self.spectate_generation, self.rows, self.level),
+            daemon=True)
+        worker.start()
+        self.spectate_id = self.after(int(1000 / self.spectate_fps),
+            self.spectate_tick)
+
+    def spectate_stop(self):
+        # Fold the results not yet counted into Running Score
+        # (before bumping generation, else they would count as stale)
+        self.spectate_score()
+
+        # Worker exits at its next check, dropping the game in hand
+        self.spectate_generation = self.spectate_generation + 1
+        if self.spectate_id is not None:
+            self.after_cancel(self.spectate_id)
+            self.spectate_id = None
+
+    def spectate_worker(self, generation, rows, level):
+        """
+        Runs in worker thread. It never touches the widgets.
+        Latest position is published via spectate_snapshot (a tuple),
+        results of finished games via spectate_queue
+        (tagged with generation, so that a late result from a stopped
+        worker never counts under new settings).
+        """
+        # Optimized engine (pinned to reference rules by TicTacToe_Harness)
+        board = TicTacToeFastBoard(rows, level, self.make_scoredict())
+        game_no = 0
+        moves = 0
+        while self.spectate_generation == generation:
+            game_no = game_no + 1
+            xlevel = self.level_list[game_no % len(self.level_list)]
+            board.new_game()
+            while not board.finished:
+                board.play_move(board.get_playermove(xlevel), "X")
+                moves = moves + 1
+                if len(board.winner) == 0 and len(board.freeslot_list) > 0:
+                    board.play_move(board.get_compmove(), "O")
+                    moves = moves + 1
+
+                board.game_status()
+                if self.spectate_generation != generation:
+                    return  # Stopped, or restarted with new settings
+
+                self.spectate_snapshot = (generation, game_no, xlevel,
+                    tuple(board.playermove_list), tuple(board.compmove_list),
+                    tuple(board.haswon_list), board.winner, board.stalemate,
+                    board.finished)
+                self.spectate_moves = moves
+
+            if board.finished and len(board.winner) == 0:
+                self.spectate_queue.put((generation, "D"))  # Drawn
+            else:
+                self.spectate_queue.put((generation, board.winner))
+
+            self.spectate_games = game_no
+
+    def spectate_score(self):
+        while True:
+            try:
+                generation, result = self.spectate_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if generation != self.spectate_generation:
+                continue  # Played under old settings
+
+            if result == "X":
+                self.update_scoredict(1, 0, 0)
+            elif result == "O":
+                self.update_scoredict(0, 1, 0)
+            else:
+                self.update_scoredict(0, 0, 1)
+
+    def spectate_tick(self):
+        self.spectate_id = None
+        self.spectate_score()
+
+        # Snapshot left by an old worker (before restart) is ignored
+        snap = self.spectate_snapshot
+        if snap is not None and snap[0] == self.spectate_generation:
+            generation, game_no, xlevel, pmoves, cmoves, haswon, winner, \
+                smate, finished = snap
+            if game_no != self.spectate_drawngame:
+                # Auto-start next game on PlayBoard
+                self.show_playboard()
+                self.spectate_drawngame = game_no
+                self.spectate_drawnmoves = (0, 0)
+
+            # Draw only the moves made since last frame
+            drawn_x, drawn_o = self.spectate_drawnmoves
+            for moves, mark, clr in ((pmoves[drawn_x:], "X", "blue"),
+                (cmoves[drawn_o:], "O", "purple")):
+                for move in moves:
+                    btn = self.playbtn_list[move - 1][0]
+                    btn["text"] = mark
+                    btn["bg"] = clr
+                    btn["font"] = "Times " \
+                        +str(self.playmark_fontsize)+" bold"
+                    btn["fg"] = "white"
+
+            self.spectate_drawnmoves = (len(pmoves), len(cmoves))
+
+            if len(winner) > 0:
+                txt = winner + " (Level " \
+                    + str(xlevel if winner == "X" else self.level) \
+                    + ") Has Won!\nWinning Set Is: \n" + str(list(haswon))
+            elif smate:
+                txt = "StaleMate! Game Is Dead & Drawn."
+            elif finished:
+                txt = "It Is A Tie! Game Drawn."
+            else:
+                txt = "Game In Progress"
+
+            # Throughput readout gets refreshed once a second
+            now = time.perf_counter()
+            t0, games0, moves0 = self.spectate_rate
+            if now - t0 >= 1:
+                self.spectate_ratetxt = "Games/Sec: " \
+                    + str(round((self.spectate_games - games0) / (now - t0))) \
+                    + "\nMoves/Sec: " \
+                    + str(round((self.spectate_moves - moves0) / (now - t0)))
+                self.spectate_rate = (now, self.spectate_games,
+                    self.spectate_moves)
+                if len(self.score_label["text"]) > 0:
+                    self.show_score()
+
+            self.notification_label["text"] = "SPECTATOR MODE" \
+                + "\nBoard: " + str(self.rows) + "x" + str(self.rows) \
+                + "\nX: Level " + str(xlevel) \
+                + "  Vs  O: Level " + str(self.level) \
+                + "\n\nGame No: " + str(game_no) + "\n" + txt \
+                + "\n\n" + self.spectate_ratetxt
+
+        self.spectate_id = self.after(int(1000 / self.spectate_fps),
+            self.spectate_tick)
+
+    def toggle_hint(self):
+        if self.spectating:
+            return  # Hints are for human's moves, none in spectator mode
+
+        self.hint_on = not self.hint_on
+        if self.hint_on:
+            self.hint_btn.config(bg="light green", bd=3)
+            if len(self.winner) == 0 and not self.stalemate:
+                # All free slots need rating at first
+                self.hintline_dict = {}
+                self.hint_dict = {}
+                self.hint_refresh(self.freeslot_list)
+        else:
+            self.hint_btn.config(bg="light gray", bd=1)
+            self.hint_clear()
+
     def show_score(self):
         txt = self.get_score()
         lbwd = int(0.85 * (self.screen_wd - self.cum_x))
@@ -311,7 +559,7 @@ class TicTacToe(tk.Tk):
         self.score_label.place(x = self.cum_x + 20,
             y = self.start_y, width=lbwd, height=lbht)
         self.score_label.lift()
-        self.score_label["text"] = self.get_score()
+        self.score_label["text"] = self.get_score() + self.get_pondertxt()
         
 
     def hide_score(self):
@@ -337,7 +585,8 @@ class TicTacToe(tk.Tk):
         self.notification_label["text"] = txt
 
     def show_playboard(self):
-        self.hide_score()
+        if not self.spectating:
+            self.hide_score()
         self.notification_label["bg"] = "white"
 
         # Reset initial values
@@ -346,6 +595,9 @@ class TicTacToe(tk.Tk):
         self.click_disabled = False
         self.haswon_list = []
         self.playermove_list = []
+        # Buttons get cleared, so in spectator mode next frame redraws
+        # the latest position from scratch
+        self.spectate_drawngame = 0
         self.compmove_list = []
         
         # rebuild freeslot_list & wincomb_list
@@ -353,7 +605,18 @@ class TicTacToe(tk.Tk):
         # wincomb_list is a list of all possible winning combinations
         self.freeslot_list = [s for s in range(1, 1 + self.rows * self.rows)]
         self.wincomb_list = self.make_wincomblist()
+        self.cellline_dict = self.make_celllinedict()
+
+        # Discard hint results belonging to previous game
+        self.hint_generation = self.hint_generation + 1
+        self.hintline_dict = {}
+        self.hint_dict = {}
+        self.hintpending_set = set()
         self.notification_update()
+
+        # Start pondering on player's first move
+        self.ponder_stop()
+        self.ponder_start()
         
         # Reposition play buttons at top left corner of screen
         # (In micro-size)
@@ -390,243 +653,208 @@ class TicTacToe(tk.Tk):
                 
             row  = row + 1
 
-    def make_wincomblist(self):
+        if self.hint_on:
+            self.hint_refresh(self.freeslot_list)
+
+    def get_hintcolor(self, rating):
         """
-        Builds a list of sublists of potential Winning Combinations
-        (Rows, Columns & diagonals)
+        Returns tint (hex color string) for a free slot as per its rating.
+        A slot completing a row/column/diagonal for X gets full tint.
+        Light gray (untinted) for a slot having no prospects for X.
         """
-        wlist = []
-        
-        # SubLists for row combinations
-        for x in range(1,
-            (self.rows * self.rows - (self.rows - 1) + 1), self.rows):
-            sublist = []
-            for n in range(self.rows):    
-                sublist.append(n + x)
-
-            wlist.append(sublist)
-
-        # SubLists for column combinations
-        for x in range(1, self.rows + 1):
-            sublist = []
-            for n in range(x,
-                x + (self.rows * self.rows - (self.rows - 1) + 1), self.rows):
-                sublist.append(n)
+        if rating == 0:
+            return "light gray"
 
-            wlist.append(sublist)
+        # Square root keeps low ratings distinguishable on big boards
+        frac = min(1.0, (rating ** 0.5) / self.rows)
+        clr_from = (211, 211, 211)  # light gray
+        clr_to = (255, 140, 0)  # dark orange
+        rgb = [int(a + (b - a) * frac) for a, b in zip(clr_from, clr_to)]
+        return "#%02x%02x%02x" % tuple(rgb)
 
+    def hint_refresh(self, changed_list):
         """
-        SubLists of two diagonal-wise combinations
-        This loop runs only for two cycles
-        In first one, it starts at first slot in top row
-        In 2nd round, it starts at last slot in top row
+        Schedules re-rating of free slots sharing a row/column/diagonal
+        with any slot in changed_list.
+        Rating runs in a worker thread. Only one worker runs at a time,
+        slots changed meanwhile get picked up by the next run.
         """
-        # Step margin between adjacent values - First Diagonal
-        sp = self.rows + 1
-        for x in range(1, self.rows + 1, self.rows - 1):
-            sublist = []
-            ct = 0        
-            while ct < self.rows:
-                n = x + sp * ct
-                sublist.append(n)
-                ct = ct + 1
-
-            # Step margin between adjacent values - 2nd Diagonal
-            sp = self.rows - 1
-
-            wlist.append(sublist)
-
-        return wlist
+        if not self.hint_on or self.spectating:
+            return
 
-    def get_bestmove_list(self, move_list):
+        self.hintpending_set.update(changed_list)
+        if not self.hint_busy:
+            self.hint_start()
+
+    def hint_start(self):
+        changed_set = self.hintpending_set
+        self.hintpending_set = set()
+        self.hint_busy = True
+
+        # Worker gets snapshots only, it never touches the widgets
+        worker = threading.Thread(target=self.hint_worker,
+            args=(self.hint_generation, changed_set,
+                self.wincomb_list, self.cellline_dict,
+                dict(self.hintline_dict), set(self.playermove_list),
+                set(self.compmove_list), set(self.freeslot_list)),
+            daemon=True)
+        worker.start()
+        self.after(20, self.hint_poll)
+
+    def hint_worker(self, generation, changed_set, wincomb_list,
+        cellline_dict, hintline_dict, playermove_set, compmove_set,
+        freeslot_set):
         """
-        Based upon moves made so far (moveList), it returns shortest list of remaining moves for win.
-        
-        wincomb_list is a list having sub-lists of possible winning combinations for rows, columns & diagonals
+        Runs in worker thread. Recomputes values of lines passing through
+        changed slots, then ratings of free slots lying on those lines.
+        Result gets handed over to main thread via hint_queue.
         """
-        # Initialize default value of bestmove_list
-        bmlist = [*self.freeslot_list]
-        # If only one slot is free, no need to check further. 
-        if len(bmlist) > 1:
-            for x in self.wincomb_list:
-                # Intersection of current sublist of winning combinations and moves made so far
-                s1 = [item for item in x if item in move_list]
-
-                if len(s1) > 0: 
-                    # Intersection difference of current sublist and s1
-                    # This represents the balance moves for win
-                    s2 = [item for item in x if item not in s1]
-                    
-                    # Intersection of s2 & free slots
-                    # (i.e. whether all potential slots in balance win list are free)
-                    s3 = [item for item in s2 if item in self.freeslot_list]
-
-                    # If all slots in s2 are free and s2 is shorter than bmList, assign the contents of s2 to s 
-                    if len(s2) == len(s3) and len(s2) < len(bmlist):
-                        bmlist = [*s2]
+        line_set = set()
+        for s in changed_set:
+            line_set.update(cellline_dict[s])
+
+        newline_dict = {}
+        for idx in line_set:
+            newline_dict[idx] = self.get_linevalue(
+                wincomb_list[idx], playermove_set, compmove_set)
+
+        hintline_dict.update(newline_dict)
+        rating_dict = {}
+        for idx in line_set:
+            for s in wincomb_list[idx]:
+                if s in freeslot_set and s not in rating_dict:
+                    rating_dict[s] = sum(
+                        [hintline_dict[i] for i in cellline_dict[s]])
+
+        self.hint_queue.put((generation, newline_dict, rating_dict))
+
+    def hint_poll(self):
+        try:
+            generation, newline_dict, rating_dict = \
+                self.hint_queue.get_nowait()
+        except queue.Empty:
+            self.after(20, self.hint_poll)
+            return
 
-                if len(bmlist) == 1:
-                    # This is a winning move. No need to explore further.
-                    break
+        self.hint_busy = False
+        # Result pertaining to an old game (or cleared overlay) is ignored
+        if generation == self.hint_generation and self.hint_on:
+            self.hintline_dict.update(newline_dict)
+            # Repaint only those free slots whose rating has changed
+            for s, rating in rating_dict.items():
+                if s in self.freeslot_list and self.hint_dict.get(s) != rating:
+                    self.hint_dict[s] = rating
+                    self.playbtn_list[s - 1][0]["bg"] = \
+                        self.get_hintcolor(rating)
+
+        if self.hint_on and len(self.hintpending_set) > 0:
+            self.hint_start()
+
+    def hint_clear(self):
+        # Results of any running worker become stale
+        self.hint_generation = self.hint_generation + 1
+        self.hintpending_set = set()
+        self.hint_dict = {}
+        if self.spectating:
+            # freeslot_list isn't kept up by spectator mode, so it
+            # would cover the slots played by the computers too
+            return
 
-        return bmlist
+        for s in self.freeslot_list:
+            self.playbtn_list[s - 1][0]["bg"] = "light gray"
 
-    def get_wonlist(self, move_list):
+    def ponder_start(self):
         """
-        If game won, returns the list of completed row/column/diagonal
-        Otherwise, an empty list
-        wincomb_list: A list having sub-lists of possible winning combinations of rows, columns & diagonals
+        Starts pondering, i.e. precomputing computer's reply for each likely
+        move of the player, while the player is thinking.
+        Work is done in small after_idle() slices, so the window stays
+        responsive. It is bounded by ponder_limit moves per position
+        and ponder_budget seconds per slice.
         """
-        wlist = []
-        moveset = set(move_list)
-        for x in self.wincomb_list:
-            if set(x).issubset(moveset):
-                wlist = x
-                break
-
-        return wlist
+        if not self.ponder_on or self.spectating or len(self.winner) > 0 \
+            or self.stalemate or len(self.freeslot_list) == 0:
+            return
 
-    def haswon(self, move_list):
+        self.ponder_list = None  # Gets built in first slice
+        self.ponder_id = self.after_idle(self.ponder_slice)
+
+    def ponder_stop(self):
+        # Cancel pending slice & throw away the cache
+        if self.ponder_id is not None:
+            self.after_cancel(self.ponder_id)
+            self.ponder_id = None
+
+        self.ponder_dict = {}
+        self.ponder_list = []
+
+    def ponder_slice(self):
+        self.ponder_id = None
+        start = time.perf_counter()
+        if self.ponder_list is None:
+            self.ponder_list = self.get_ponderlist()
+
+        while len(self.ponder_list) > 0 and \
+            time.perf_counter() - start < self.ponder_budget:
+            move = self.ponder_list.pop(0)
+
+            # Position after player's move, on a scratch board
+            board = TicTacToeBoard(self.rows, self.level, self.score_dict)
+            board.playermove_list = [*self.playermove_list, move]
+            board.compmove_list = [*self.compmove_list]
+            board.freeslot_list = list(
+                filter(lambda x: x != move, self.freeslot_list))
+
+            # No reply needed if the move wins or fills the last slot
+            if not board.haswon(board.playermove_list) \
+                and len(board.freeslot_list) > 0:
+                key = (frozenset(board.playermove_list),
+                    frozenset(board.compmove_list))
+                self.ponder_dict[key] = board.get_compmove()
+
+        if len(self.ponder_list) > 0:
+            self.ponder_id = self.after_idle(self.ponder_slice)
+
+    def get_ponderlist(self):
         """
-        Finds whether move_list represents Victory
-        (completed row/column/diagonal)
-
-        wincomb_list: A list having sub-lists of possible winning combinations for rows, columns & diagonals
+        Returns free slots most likely to be picked by the player
+        (best rated for X first), limited to ponder_limit slots
         """
-        won = False
-        moveset = set(move_list)
-        for x in self.wincomb_list:
-            if set(x).issubset(moveset):
-                won = True
-                break
-
-        return won
-
-    def is_stalemate(self):
+        playermove_set = set(self.playermove_list)
+        compmove_set = set(self.compmove_list)
+        lineval_list = [self.get_linevalue(x, playermove_set, compmove_set)
+            for x in self.wincomb_list]
+        rating_dict = {}
+        for s in self.freeslot_list:
+            rating_dict[s] = sum(
+                [lineval_list[i] for i in self.cellline_dict[s]])
+
+        plist = sorted(self.freeslot_list, key=lambda s: -rating_dict[s])
+        return plist[:self.ponder_limit]
+
+    def ponder_take(self):
         """
-        Finds whether whether the game has reached a stalemate
-        (Despite free slots, winning combination is no longer feasible)
-
-        wincomb_list: A list of sub-lists of possible winning combinations for rows, columns & diagonals
+        Returns computer's reply for current position
+        From ponder cache if available, otherwise computed right now
         """
-        smate = True
-        for x in self.wincomb_list:
-            # Check if any sublist of winning combinations is still pure
-            # (Free from a mix of player & computer moves in same sublist)
-            if len([item for item in x if item in self.playermove_list]) == 0 \
-                or len([item for item in x if item in self.compmove_list]) == 0:
-                smate = False
-                break
+        key = (frozenset(self.playermove_list), frozenset(self.compmove_list))
+        move = self.ponder_dict.get(key, 0)
+        if move > 0:
+            self.ponder_hits = self.ponder_hits + 1
+        else:
+            self.ponder_misses = self.ponder_misses + 1
+            move = self.get_compmove()
 
-        return smate
+        return move
 
-    def get_compmove(self):
-        """
-        Determines computer's next move.
-        wincomb_list: A list having sub-lists of winning combinations for rows, columns & diagonals
-        compmove_list is a list holding moves made by the computer.
-        playermove_list is a list holding moves made by the player.
-        freeslot_list is a list of free slots still available.
-
-        level is the difficulty level, i.e. strength setting for computer
-        Options: 0 / 1 / 2  (Defaul Level Is 1)
-        Level 0 - Computer plays random moves and discontinues blocking opponents victory, after 50% slots get filled up
-        Level 1 - Computer plays optimum moves but discontinues blocking opponents victory, after 70% slots get filled up
-        Level 2 - Computer plays at full strength as follows:
-             (a) Firstly, go for immediate win if available.
-             (b) Otherwise, block opponent if on the verge of immediate win.
-             (c) Otherwise, pick up a move from shortest winning path available.
-        """
-        if len(self.freeslot_list) == 0:
-            # No move available
-            return 0
-        
-        cm = 0  # default value for computer move
-        
-        # Get the list of best moves available for player
-        bestplayermove_list = self.get_bestmove_list(
-            self.playermove_list)
-        
-        if self.level > 0:
-            # Get the list of best moves available for computer
-            bestcompmove_list = self.get_bestmove_list(
-                self.compmove_list)
-            
-            if len(bestcompmove_list) > 1:
-                # There is no immediate win for computer.
-                # Check if the player has an immediate win in sight
-                if len(bestplayermove_list) == 1:
-                    # There is an immediate win for player.
-                    # Block it if level is 2
-                    # Or for level 1 and more than 30% free slots available
-                    if self.level ==2 or (self.level == 1 and
-                        len(self.freeslot_list) > \
-                            round((self.rows * self.rows * 0.3))):
-                        # Block opponent's win
-                        cm = bestplayermove_list[0]
-                else:
-                    # Select a random value from bestcompmove_list
-                    cm = random.choice(bestcompmove_list)
-            else:
-                # The computer has an immediate winning move:
-                cm = bestcompmove_list[0]
-        else:
-            # Computer is playing at level 0 (weak strength)
-            # If more than 50% free slots are still available
-            # And the player has an immediate win in sight, block it
-            if len(bestplayermove_list) == 1 and \
-                len(self.freeslot_list) > \
-                round((self.rows * self.rows * 0.5)):
-                    cm = bestplayermove_list[0]
-
-        if cm == 0:
-            # Select a random value from freeslot_list
-            cm = random.choice(self.freeslot_list)
-
-        return cm
-
-    def update_scoredict(self, 
-        playerwin, compwin, drawn):
-        # The arguments: 0 or 1 (e.g. 1,0,0 / 0,1,0 / 0,0,1)
-        self.score_dict[self.level][self.rows][0] = \
-            self.score_dict[self.level][self.rows][0] + playerwin
-        self.score_dict[self.level][self.rows][1] = \
-            self.score_dict[self.level][self.rows][1] + compwin
-        self.score_dict[self.level][self.rows][2] = \
-            self.score_dict[self.level][self.rows][2] + drawn
-
-    def get_score(self):
-        txt = ""
-        totgames = 0
-        totplayerwins = 0
-        totcompwins = 0
-        totdrawn = 0
-        for lev in self.level_list:
-            subdict = self.score_dict[lev]
-            for board in self.board_list:
-                scorelist = subdict[board]
-                games = sum(scorelist)
-                totgames = totgames + games
-                totplayerwins = totplayerwins + scorelist[0]
-                totcompwins = totcompwins + scorelist[1]
-                totdrawn = totdrawn + scorelist[2]
-                if games > 0:
-                    txt = txt + "\nDifficulty Level: " + str(lev) \
-                        + ", Board Size: " + str(board) + "x" + str(board)
-                    txt= txt + "\nGames: " \
-                         + str(games) + ", PlayerWins: " \
-                        + str(scorelist[0]) + ", CompWins: " \
-                        + str(scorelist[1]) + ", Drawn: " \
-                        + str(scorelist[2]) + "\n"
-
-        #txt = txt + "\nOverAll Summary-Grand Total:"
-        txt1 = "\nOverAll Summary-Grand Total:"
-        txt1 = txt1 + "\nTot Games: " \
-            + str(totgames) + ", PlayerWins: " \
-            + str(totplayerwins) + ", CompWins: " \
-            + str(totcompwins) + ", Drawn: " + str(totdrawn)
-        txt = "Cumulative Score:" + txt1 + "\n" + txt
-        return txt
+    def get_pondertxt(self):
+        replies = self.ponder_hits + self.ponder_misses
+        if replies == 0:
+            return ""
+
+        return "\nPondering: Replies Ready In Advance: " \
+            + str(self.ponder_hits) + " Of " + str(replies) \
+            + " (Hit Rate " + str(round(100 * self.ponder_hits / replies)) \
+            + "%)"
 
     def blink(self, blinkobject, cycles=6, delay=200):        
         self.ct = 0    
@@ -657,8 +885,11 @@ class TicTacToe(tk.Tk):
         if self.click_disabled:
             return
 
-        self.click_disabled = True
         btnlistkey = keylist[0]
+        if self.spectating and btnlistkey == 3:
+            return  # PlayBoard belongs to the computers
+
+        self.click_disabled = True
         btnlist = self.btn_dict[btnlistkey]
         btnsublist_index = keylist[1]
         btnsublist = btnlist[btnsublist_index]
@@ -681,19 +912,27 @@ class TicTacToe(tk.Tk):
 
                 # Highlight the clicked button in green
                 btn.config(bg="light green", bd = 3)
+                if self.spectating:
+                    self.spectate_stop()
+
                 if btnlistkey == 1:
                     self.rows = btnval
                 else:
                     self.level = btnval
 
                 self.show_playboard()
+                if self.spectating:
+                    # Restart computer-vs-computer play with new settings
+                    self.spectate_start()
 
         else:
             if len(self.winner) > 0 or self.stalemate \
                 or len(self.freeslot_list) == 0:
                 return   # Game Finished
                 
+            movesmade_list = []
             if btnval in self.freeslot_list:
+                movesmade_list.append(btnval)
                 btn["text"] = "X"
                 btn["bg"] = "blue"
                 btn["font"] = "Times " \
@@ -715,7 +954,8 @@ class TicTacToe(tk.Tk):
                 if not self.stalemate and self.winner == "" \
                     and len(self.freeslot_list) > 0:
                     # Get Computer's Move
-                    move = self.get_compmove()
+                    # (Precomputed while player was thinking, if available)
+                    move = self.ponder_take()
                     if move > 0:
                         btnsublist = self.playbtn_list[move - 1]
                         btn = btnsublist[0]
@@ -731,13 +971,24 @@ class TicTacToe(tk.Tk):
                             filter(lambda x: x != move, self.freeslot_list))
                         
                         self.compmove_list.append(move)
+                        movesmade_list.append(move)
                         
                         self.haswon_list = \
                             self.get_wonlist(self.compmove_list)
                         if len(self.haswon_list) > 0:
                             self.winner = "O"
 
+                # Ponder cache is of no use once the real move has arrived
+                self.ponder_stop()
+
             self.game_status()
+            if len(self.winner) > 0 or self.stalemate \
+                or len(self.freeslot_list) == 0:
+                self.hint_clear()  # No more hints for a finished game
+            elif len(movesmade_list) > 0:
+                # Re-rate slots around the moves just made
+                self.hint_refresh(movesmade_list)
+                self.ponder_start()
                 
         self.click_disabled = False
 
@@ -787,6 +1038,266 @@ class TicTacToe(tk.Tk):
             self.notification_label["text"] = txt + txt1
             self.notification_label["bg"] = "yellow"
 
+class SimulWindow(tk.Toplevel):
+    """
+    Simul Mode: Human Player plays many independent boards at once
+    Each board (TicTacToeBoard) has its own size & difficulty level.
+    Boards are drawn on a single canvas (64 buttons per board won't scale).
+    Human's moves are collected for reply_delay ms, then computer's
+    replies for all boards awaiting it are fetched by one get_compmoves()
+    call (a per-board loop, the boards share no search work).
+    Only boards that changed get redrawn.
+    """
+    board_px = 200  # Width (& height) of each board in pixels
+    hdr_px = 22  # Height of header text above each board
+    gap_px = 12  # Gap between boards
+    reply_delay = 250  # ms to wait for more moves before computer replies
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent
+        self.title("TIC TAC TOE: Simul Mode - Play Many Boards At Once")
+        wd = int(0.9 * parent.screen_wd)
+        ht = int(0.85 * parent.screen_ht)
+        self.geometry("%dx%d+%d+%d" % (wd, ht, 20, 20))
+
+        self.board_list = []  # List of TicTacToeBoard objects
+        self.item_list = []  # Per board: [hdr text, cell rects, cell texts]
+        self.drawn_list = []  # Per board: (mark, color) last drawn per slot
+        self.pending_list = []  # Boards awaiting computer's reply
+        self.dirty_set = set()  # Indices of boards needing redraw
+        self.reply_id = None  # after() id of scheduled computer reply
+        self.cols = max(1, (wd - self.gap_px) // (self.board_px + self.gap_px))
+
+        self.make_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+    def close(self):
+        # Scheduled reply must not fire on a destroyed window
+        if self.reply_id is not None:
+            self.after_cancel(self.reply_id)
+            self.reply_id = None
+
+        self.destroy()
+
+    def make_widgets(self):
+        fontsize = int(self.parent.fontsize_hdg / 2)
+        font = "Times "+str(fontsize)+" bold"
+        bar = tk.Frame(self)
+        bar.pack(side="top", fill="x")
+
+        # Spinboxes for number of boards, board size & difficulty level
+        self.count_var = tk.StringVar(value="4")
+        self.size_var = tk.StringVar(value=str(self.parent.rows))
+        self.level_var = tk.StringVar(value=str(self.parent.level))
+        for txt, var, frm, to in (("Boards", self.count_var, 1, 64),
+            ("Board Size", self.size_var, 3, 8),
+            ("Level", self.level_var, 0, 2)):
+            tk.Label(bar, text=txt, font=font).pack(side="left", padx=5)
+            tk.Spinbox(bar, textvariable=var, from_=frm, to=to, width=3,
+                font=font, state="readonly").pack(side="left")
+
+        for txt, cmd in (("Add Boards", self.add_boards),
+            ("New Games", self.new_games),
+            ("Clear All", self.clear_boards)):
+            tk.Button(bar, text=txt, font=font, bg="light gray",
+                command=cmd).pack(side="left", padx=5)
+
+        self.status_label = tk.Label(bar, text="", font=font)
+        self.status_label.pack(side="left", padx=10)
+
+        self.canvas = tk.Canvas(self, bg="white")
+        scroll = tk.Scrollbar(self, orient="vertical",
+            command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=scroll.set)
+        scroll.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Button-1>", self.canvas_click)
+
+    def board_origin(self, idx):
+        # Top left corner of board's header (canvas coordinates)
+        col = idx % self.cols
+        row = idx // self.cols
+        x = self.gap_px + col * (self.board_px + self.gap_px)
+        y = self.gap_px + row * (self.board_px + self.hdr_px + self.gap_px)
+        return x, y
+
+    def add_boards(self):
+        rows = int(self.size_var.get())
+        level = int(self.level_var.get())
+        for n in range(int(self.count_var.get())):
+            board = TicTacToeBoard(rows, level, self.parent.score_dict)
+            self.board_list.append(board)
+            self.make_boarditems(len(self.board_list) - 1)
+
+        rows_used = (len(self.board_list) + self.cols - 1) // self.cols
+        self.canvas.configure(scrollregion=(0, 0,
+            self.cols * (self.board_px + self.gap_px) + self.gap_px,
+            rows_used * (self.board_px + self.hdr_px + self.gap_px)
+            + self.gap_px))
+        self.render()
+
+    def make_boarditems(self, idx):
+        board = self.board_list[idx]
+        x0, y0 = self.board_origin(idx)
+        fontsize = int(0.6 * self.board_px / board.rows)
+        cell_px = self.board_px / board.rows
+        hdr = self.canvas.create_text(x0, y0, anchor="nw", text="",
+            font="Times 11 bold")
+        rect_list = []
+        text_list = []
+        for s in range(1, 1 + board.rows * board.rows):
+            x = x0 + cell_px * ((s - 1) % board.rows)
+            y = y0 + self.hdr_px + cell_px * ((s - 1) // board.rows)
+            rect_list.append(self.canvas.create_rectangle(
+                x, y, x + cell_px, y + cell_px,
+                fill="light gray", outline="white"))
+            text_list.append(self.canvas.create_text(
+                x + cell_px / 2, y + cell_px / 2, text="",
+                fill="white", font="Times "+str(fontsize)+" bold"))
+
+        self.item_list.append([hdr, rect_list, text_list])
+        self.drawn_list.append([("", "light gray")] * (board.rows * board.rows))
+        self.dirty_set.add(idx)
+
+    def new_games(self):
+        self.pending_list = []
+        for idx, board in enumerate(self.board_list):
+            board.new_game()
+            self.dirty_set.add(idx)
+
+        self.render()
+
+    def clear_boards(self):
+        if self.reply_id is not None:
+            self.after_cancel(self.reply_id)
+            self.reply_id = None
+
+        self.canvas.delete("all")
+        self.board_list = []
+        self.item_list = []
+        self.drawn_list = []
+        self.pending_list = []
+        self.dirty_set = set()
+        self.render()
+
+    def canvas_click(self, event):
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        col = int((x - self.gap_px) // (self.board_px + self.gap_px))
+        row = int((y - self.gap_px) //
+            (self.board_px + self.hdr_px + self.gap_px))
+        if col < 0 or col >= self.cols or row < 0:
+            return
+
+        idx = row * self.cols + col
+        if idx >= len(self.board_list):
+            return
+
+        board = self.board_list[idx]
+        x0, y0 = self.board_origin(idx)
+        lx = x - x0
+        ly = y - y0 - self.hdr_px
+        if lx < 0 or ly < 0 or lx >= self.board_px or ly >= self.board_px:
+            return  # Click on header or gap
+
+        # Ignore click if the game is over or computer is yet to reply
+        if board.finished or board in self.pending_list:
+            return
+
+        move = int(ly * board.rows // self.board_px) * board.rows \
+            + int(lx * board.rows // self.board_px) + 1
+        if not board.play_move(move, "X"):
+            return
+
+        self.dirty_set.add(idx)
+        if len(board.winner) > 0 or len(board.freeslot_list) == 0:
+            board.game_status()
+            # Shared score_dict changed, keep main window's score current
+            if len(self.parent.score_label["text"]) > 0:
+                self.parent.show_score()
+        else:
+            self.pending_list.append(board)
+            # Let the human move on other boards, then reply to all at once
+            if self.reply_id is None:
+                self.reply_id = self.after(self.reply_delay,
+                    self.reply_pending)
+
+        self.render()
+
+    def reply_pending(self):
+        self.reply_id = None
+        board_list = self.pending_list
+        self.pending_list = []
+
+        # One call for all boards awaiting reply (a per-board loop inside)
+        move_list = get_compmoves(board_list)
+        for board, move in zip(board_list, move_list):
+            if move > 0:
+                board.play_move(move, "O")
+
+            board.game_status()
+            self.dirty_set.add(self.board_list.index(board))
+
+        # Shared score_dict may have changed, keep main window's score current
+        if len(self.parent.score_label["text"]) > 0:
+            self.parent.show_score()
+
+        self.render()
+
+    def render(self):
+        """
+        Redraws boards in dirty_set, touching only slots whose mark changed
+        """
+        for idx in self.dirty_set:
+            board = self.board_list[idx]
+            hdr, rect_list, text_list = self.item_list[idx]
+            drawn = self.drawn_list[idx]
+            for s in range(1, 1 + board.rows * board.rows):
+                if s in board.playermove_list:
+                    mark = "X"
+                    clr = "blue"
+                elif s in board.compmove_list:
+                    mark = "O"
+                    clr = "purple"
+                else:
+                    mark = ""
+                    clr = "light gray"
+
+                if s in board.haswon_list:
+                    clr = "dark orange"  # Winning set gets highlighted
+
+                if drawn[s - 1] != (mark, clr):
+                    drawn[s - 1] = (mark, clr)
+                    self.canvas.itemconfigure(rect_list[s - 1], fill=clr)
+                    self.canvas.itemconfigure(text_list[s - 1], text=mark)
+
+            if board.winner == "X":
+                txt = "You (X) Have Won!"
+            elif board.winner == "O":
+                txt = "Computer (O) Has Won!"
+            elif board.stalemate:
+                txt = "StaleMate! Drawn"
+            elif board.finished:
+                txt = "Tie! Drawn"
+            elif board in self.pending_list:
+                txt = "Computer Thinking..."
+            else:
+                txt = "Your Move"
+
+            self.canvas.itemconfigure(hdr,
+                text="#" + str(idx + 1) + "  " + str(board.rows) + "x"
+                + str(board.rows) + "  Level " + str(board.level)
+                + "  -  " + txt)
+
+        self.dirty_set = set()
+
+        # Overall status
+        live = len([b for b in self.board_list if not b.finished])
+        self.status_label["text"] = "Boards: " + str(len(self.board_list)) \
+            + ", Live: " + str(live) \
+            + ", Awaiting Computer: " + str(len(self.pending_list))
+
 #============================
 
 if __name__ == "__main__":